@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import List, Tuple
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from chart_builder import (TITLE, X_AXIS_LABEL,
+                           MAIN_CURRENCY_SALARY_LABEL, MAIN_CURRENCY_COLOR, VALUE_CHANGE_LABEL, VALUE_CHANGE_COLOR,
+                           USD_SALARY_LABEL, USD_COLOR)
+from core.currency_converter import CurrencySalaryConverter
+from core.models import EmploymentPeriod, Currency
+from core.purchasing_power_converter import purchasing_power_converters
+from core.salary_calculator.salary_calculator import SalaryCalculator
+from core.step_series import StepSeries
+
+ANIMATION_DPI = 100  # Frames are held by workers and the GIF encoder, OUT_PUT_DPI makes them far too large
+FRAME_DURATION_MS = 80
+LAST_FRAME_DURATION_MS = 3000
+Y_LIMIT_MARGIN_RATIO = 0.05
+
+Series = Tuple[List[date], List[int]]
+
+
+class AnimationData:
+    """
+    Series computed once in the parent process and shipped to every frame worker
+    """
+
+    def __init__(self, main_currency: Currency, main: Series, value_change: Series, usd: Series):
+        self.main_currency = main_currency
+        self.main = main
+        self.value_change = value_change
+        self.usd = usd
+
+    @property
+    def months(self) -> List[date]:
+        return sorted(set(self.main[0]) | set(self.value_change[0]) | set(self.usd[0]))
+
+
+def _monthly_series(series: StepSeries) -> Series:
+    # Frames advance month by month, so the lines need every month, not only the change points
+    pairs = [(month, amount) for month, amount in series.items() if amount is not None]
+    return [month for month, _ in pairs], [amount for _, amount in pairs]
+
+
+def prepare_animation_data(salary_data: List[EmploymentPeriod], main_currency: Currency) -> AnimationData:
+    calculator = SalaryCalculator(CurrencySalaryConverter(), purchasing_power_converters)
+    converted = calculator.convert_series(salary_data, list({main_currency, Currency.USD}), [Currency.RUB])
+
+    return AnimationData(main_currency,
+                         _monthly_series(converted.salaries[main_currency]),
+                         _monthly_series(converted.salaries_purchasing_power[Currency.RUB]),
+                         _monthly_series(converted.salaries[Currency.USD]))
+
+
+def _y_limits(*series: Series):
+    amounts = [amount for _, series_amounts in series for amount in series_amounts]
+    if not amounts:
+        return 0, 1
+    margin = (max(amounts) - min(amounts)) * Y_LIMIT_MARGIN_RATIO or 1
+    return min(amounts) - margin, max(amounts) + margin
+
+
+class _FrameRenderer:
+    """
+    Builds the figure once; every frame only updates line data
+    """
+
+    def __init__(self, data: AnimationData, dpi: int):
+        self._data = data
+        self._dpi = dpi
+
+        self._figure = Figure(figsize=(12, 8))
+        FigureCanvasAgg(self._figure)
+        y_axis1 = self._figure.subplots()
+        y_axis1.set_title(TITLE, fontsize=22)
+        y_axis1.set_xlabel(X_AXIS_LABEL)
+
+        y_axis2 = y_axis1.twinx()
+        y_axis1.zorder = 2
+        y_axis2.zorder = 1
+        y_axis1.patch.set_visible(False)
+        y_axis1.grid(True)
+        y_axis2.grid(True)
+
+        months = data.months
+        if months:
+            y_axis1.set_xlim(months[0], months[-1])
+        y_axis1.set_ylim(*_y_limits(data.main, data.value_change))
+        y_axis2.set_ylim(*_y_limits(data.usd))
+
+        y_axis1.set_ylabel(data.main_currency.name, color=MAIN_CURRENCY_COLOR)
+        y_axis1.tick_params(axis='y', labelcolor=MAIN_CURRENCY_COLOR)
+        y_axis2.set_ylabel(Currency.USD.name, color=USD_COLOR)
+        y_axis2.tick_params(axis='y', labelcolor=USD_COLOR)
+
+        self._lines = [
+            (y_axis1.step([], [], color=MAIN_CURRENCY_COLOR,
+                          label=f'{MAIN_CURRENCY_SALARY_LABEL} ({data.main_currency.name})')[0], data.main),
+            (y_axis1.step([], [], color=VALUE_CHANGE_COLOR, label=VALUE_CHANGE_LABEL)[0], data.value_change),
+            (y_axis2.step([], [], color=USD_COLOR, label=USD_SALARY_LABEL)[0], data.usd),
+        ]
+
+        y_axis1.legend(loc='upper left')
+        y_axis2.legend(loc='lower right')
+        self._figure.autofmt_xdate()
+
+    def render(self, month: date, path: str):
+        for line, (months, amounts) in self._lines:
+            count = bisect_right(months, month)
+            line.set_data(months[:count], amounts[:count])
+        self._figure.savefig(path, dpi=self._dpi, format='png')
+
+
+def _render_frames(data: AnimationData, frames: List[Tuple[int, date]], out_dir: str, dpi: int) -> List[str]:
+    renderer = _FrameRenderer(data, dpi)
+    paths = []
+    for idx, month in frames:
+        path = os.path.join(out_dir, 'frame_%05d.png' % idx)
+        renderer.render(month, path)
+        paths.append(path)
+    return paths
+
+
+def render_frames(data: AnimationData, out_dir: str, dpi: int = ANIMATION_DPI, workers: int = None) -> List[str]:
+    workers = workers or os.cpu_count() or 1
+    frames = list(enumerate(data.months))
+    if not frames:
+        return []
+    # Contiguous chunks: each worker builds one figure and reuses it for all its frames
+    chunk_size = max(1, -(-len(frames) // workers))
+    chunks = [frames[i:i + chunk_size] for i in range(0, len(frames), chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        results = executor.map(_render_frames,
+                               [data] * len(chunks), chunks, [out_dir] * len(chunks), [dpi] * len(chunks))
+        return [path for paths in results for path in paths]
+
+
+def assemble_gif(frame_paths: List[str], output: str):
+    """
+    Writes frames one by one, so only a single frame is kept in memory
+    """
+    from PIL import Image, GifImagePlugin  # Pillow is installed along with matplotlib
+
+    if not frame_paths:
+        raise ValueError('No frames to assemble, salary data is empty')
+
+    with open(output, 'wb') as f:
+        for idx, path in enumerate(frame_paths):
+            with Image.open(path) as frame:
+                frame = frame.convert('RGB').quantize(colors=256)
+
+            if idx == 0:
+                header, _ = GifImagePlugin.getheader(frame, info={'loop': 0, 'duration': FRAME_DURATION_MS})
+                f.write(b''.join(header))
+
+            duration = LAST_FRAME_DURATION_MS if idx == len(frame_paths) - 1 else FRAME_DURATION_MS
+            f.write(b''.join(GifImagePlugin.getdata(frame, duration=duration, include_color_table=True)))
+        f.write(b';')  # GIF trailer
+
+
+def build_animation(salary_data: List[EmploymentPeriod],
+                    main_currency: Currency,
+                    output: str = 'salary.gif',
+                    dpi: int = ANIMATION_DPI,
+                    workers: int = None):
+    data = prepare_animation_data(salary_data, main_currency)
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        assemble_gif(render_frames(data, out_dir, dpi, workers), output)
+
+
+if __name__ == '__main__':
+    from cli import EXAMPLE_PERIODS
+
+    build_animation(EXAMPLE_PERIODS, Currency.RUB)
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import math
-from datetime import date, datetime
 from statistics import mode
 from typing import List, Any, Dict
 
@@ -10,10 +9,10 @@ import matplotlib.pyplot as plt
 
 from core.currency_converter import CurrencySalaryConverter
 from core.date_util import month_generator
-from core.models import EmploymentPeriod, Salary, Currency
+from core.models import EmploymentPeriod, Currency
 from core.purchasing_power_converter import purchasing_power_converters
 from core.salary_calculator.salary_calculator import SalaryCalculator
-from core.yearly_calculator.yearly_stats import print_yearly_stats
+from core.step_series import StepSeries
 
 OUT_PUT_DPI = 400
 OUTPUT_FORMAT = 'svg'  # 'png' is also supported
@@ -55,6 +54,11 @@ class GraphData:
     def __init__(self, salary: Dict[str, int]):
         self._salary = {key: value for key, value in salary.items() if value is not None}
 
+    @classmethod
+    def from_series(cls, series: StepSeries) -> 'GraphData':
+        # Step plot needs the change points only, not every month
+        return cls(dict(zip(*series.change_points())))
+
     @property
     def months(self):
         return list(self._salary.keys())
@@ -77,16 +81,12 @@ class EmploymentData:
         return self._months.copy()
 
     def salaries(self, new_currency: Currency) -> GraphData:
-        return GraphData(self._salaries(new_currency))
-
-    def _salaries(self, new_currency: Currency) -> Dict[str, int]:
-        salary = self._salary_calculator.convert(self._periods, [new_currency], [])
-
-        return {dt: converted[new_currency] for dt, converted in salary.salaries.items()}
+        salary = self._salary_calculator.convert_series(self._periods, [new_currency], [])
+        return GraphData.from_series(salary.salaries[new_currency])
 
     def value_change(self) -> GraphData:
-        salary = self._salary_calculator.convert(self._periods, [], [Currency.RUB])
-        return GraphData({dt: converted[Currency.RUB] for dt, converted in salary.salaries_purchasing_power.items()})
+        salary = self._salary_calculator.convert_series(self._periods, [], [Currency.RUB])
+        return GraphData.from_series(salary.salaries_purchasing_power[Currency.RUB])
 
     @property
     def most_frequent_currency(self) -> Currency:
@@ -253,11 +253,8 @@ def stylize_plot():
 
 
 if __name__ == '__main__':
-    periods: List[EmploymentPeriod] = [
-        EmploymentPeriod('Zavod, LLC', date(2014, 3, 1), date(2016, 3, 31), Salary(40000, Currency.RUB)),
-        EmploymentPeriod('Zavod, LLC', date(2016, 4, 1), date(2018, 3, 31), Salary(50000, Currency.RUB)),
-        EmploymentPeriod('Zavod, LLC', date(2018, 4, 1), datetime.now().date(), Salary(60000, Currency.RUB)),
-    ]
-
-    print_yearly_stats(periods, [Currency.USD, Currency.EUR, Currency.RUB])
-    build_graph(periods, Currency.RUB)
+    from cli import EXAMPLE_PERIODS
+    from core.yearly_calculator.yearly_stats import print_yearly_stats
+
+    print_yearly_stats(EXAMPLE_PERIODS, [Currency.USD, Currency.EUR, Currency.RUB])
+    build_graph(EXAMPLE_PERIODS, Currency.RUB)
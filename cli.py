@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Command line entry points.
+
+Only `chart` and `animate` commands load matplotlib, so `stats` and `export` start fast.
+"""
+import argparse
+import csv
+import json
+import sys
+from datetime import date, datetime
+from typing import List
+
+from core.models import EmploymentPeriod, Salary, Currency
+
+EXAMPLE_PERIODS: List[EmploymentPeriod] = [
+    EmploymentPeriod('Zavod, LLC', date(2014, 3, 1), date(2016, 3, 31), Salary(40000, Currency.RUB)),
+    EmploymentPeriod('Zavod, LLC', date(2016, 4, 1), date(2018, 3, 31), Salary(50000, Currency.RUB)),
+    EmploymentPeriod('Zavod, LLC', date(2018, 4, 1), datetime.now().date(), Salary(60000, Currency.RUB)),
+]
+
+JSON_DATE_FMT = '%Y-%m-%d'
+
+
+def load_periods(path: str) -> List[EmploymentPeriod]:
+    """
+    Reads periods from a JSON list of
+    {"company": ..., "begin": "YYYY-MM-DD", "end": "YYYY-MM-DD" or null, "amount": ..., "currency": "RUB"}
+    """
+    with open(path, 'rb') as f:
+        entries = json.load(f)
+
+    return [EmploymentPeriod(entry['company'],
+                             datetime.strptime(entry['begin'], JSON_DATE_FMT).date(),
+                             datetime.strptime(entry['end'], JSON_DATE_FMT).date()
+                             if entry.get('end') else datetime.now().date(),
+                             Salary(entry['amount'], Currency[entry['currency']]))
+            for entry in entries]
+
+
+def stats(args):
+    from core.yearly_calculator.yearly_stats import print_yearly_stats
+
+    print_yearly_stats(args.periods, args.currencies)
+
+
+def export(args):
+    from core.currency_converter import CurrencySalaryConverter
+    from core.purchasing_power_converter import purchasing_power_converters
+    from core.salary_calculator.salary_calculator import SalaryCalculator
+
+    calculator = SalaryCalculator(CurrencySalaryConverter(), purchasing_power_converters)
+    converted = calculator.convert(args.periods, args.currencies, args.currencies_purchasing_power)
+
+    writer = csv.writer(args.output)
+    writer.writerow(['month']
+                    + [currency.name for currency in args.currencies]
+                    + [f'{currency.name}_purchasing_power' for currency in args.currencies_purchasing_power])
+
+    for month in sorted(converted.salaries.keys() | converted.salaries_purchasing_power.keys()):
+        salaries = converted.salaries.get(month, {})
+        salaries_purchasing_power = converted.salaries_purchasing_power.get(month, {})
+        writer.writerow([month.strftime(JSON_DATE_FMT)]
+                        + [salaries.get(currency) for currency in args.currencies]
+                        + [salaries_purchasing_power.get(currency)
+                           for currency in args.currencies_purchasing_power])
+
+
+def chart(args):
+    from chart_builder import build_graph
+
+    build_graph(args.periods, args.main_currency)
+
+
+def animate(args):
+    from chart_animation import ANIMATION_DPI, build_animation
+
+    build_animation(args.periods, args.main_currency, args.output, args.dpi or ANIMATION_DPI, args.workers)
+
+
+def _currency_list(value: str) -> List[Currency]:
+    return [Currency[name.strip().upper()] for name in value.split(',') if name.strip()]
+
+
+def _currency(value: str) -> Currency:
+    return Currency[value.strip().upper()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Take a look at the purchasing power of your salary')
+    parser.add_argument('--periods', help='JSON file with employment periods (hardcoded example by default)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    stats_parser = subparsers.add_parser('stats', help='print yearly salary statistics')
+    stats_parser.add_argument('--currencies', type=_currency_list, default=[Currency.USD, Currency.EUR, Currency.RUB])
+    stats_parser.set_defaults(handler=stats)
+
+    export_parser = subparsers.add_parser('export', help='export monthly salaries as CSV')
+    export_parser.add_argument('--currencies', type=_currency_list, default=[Currency.RUB, Currency.USD])
+    export_parser.add_argument('--purchasing-power', dest='currencies_purchasing_power',
+                               type=_currency_list, default=[Currency.RUB])
+    export_parser.add_argument('--output', type=argparse.FileType('w', encoding='utf-8'), default=sys.stdout)
+    export_parser.set_defaults(handler=export)
+
+    chart_parser = subparsers.add_parser('chart', help='draw salary chart')
+    chart_parser.add_argument('--main-currency', type=_currency, default=Currency.RUB)
+    chart_parser.set_defaults(handler=chart)
+
+    animate_parser = subparsers.add_parser('animate', help='render animated GIF of the chart growing month by month')
+    animate_parser.add_argument('--main-currency', type=_currency, default=Currency.RUB)
+    animate_parser.add_argument('--output', default='salary.gif')
+    animate_parser.add_argument('--dpi', type=int, help='frame resolution (100 by default)')
+    animate_parser.add_argument('--workers', type=int, help='frame rendering processes (CPU count by default)')
+    animate_parser.set_defaults(handler=animate)
+
+    return parser
+
+
+def main(argv: List[str] = None):
+    args = build_parser().parse_args(argv)
+    args.periods = load_periods(args.periods) if args.periods else EXAMPLE_PERIODS
+    args.handler(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,4 @@
 from .converters import CurrencySalaryConverter
+from .store import ConversionStore
 
-__all__ = ['CurrencySalaryConverter']
+__all__ = ['CurrencySalaryConverter', 'ConversionStore']
@@ -1,64 +1,247 @@
+import threading
 from collections import defaultdict
 from datetime import date
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from currency_converter import CurrencyConverter, RateNotFoundError
 
-from core.date_util import month_generator
-from ..models import EmploymentPeriod, Currency
+from core.date_util import add_months, last_month, month_generator
+from core.step_series import StepSeries
+from .store import ConversionStore
+from ..models import EmploymentPeriod, Currency, Salary
 
 __all__ = ['CurrencySalaryConverter']
 
 FULL_DATA_CURRENCY_RATES_DATA_URL = 'http://www.ecb.int/stats/eurofxref/eurofxref-hist.zip'
+CONVERSION_STORE_PATH = 'core/currency_converter/conversions.sqlite3'
+
+
+def _load_currency_converter() -> CurrencyConverter:
+    return CurrencyConverter(FULL_DATA_CURRENCY_RATES_DATA_URL,
+                             fallback_on_missing_rate=True,
+                             # RUB rate could not be found in 2022-04 and later on,
+                             # thus these dates are considered wrong (out of known interval)
+                             fallback_on_wrong_date=False)
+
+
+class _Rates:
+    """
+    Snapshot of rates and the store versioned by them, swapped in as a whole on refresh.
+    Rates are downloaded only once a conversion misses the store, and never change afterwards
+    """
+
+    def __init__(self, store: Optional[ConversionStore], currency_converter: Optional[CurrencyConverter] = None):
+        self.store = store
+        self._currency_converter = currency_converter
+        self._lock = threading.Lock()
+
+    @property
+    def currency_converter(self) -> CurrencyConverter:
+        currency_converter = self._currency_converter
+        if currency_converter is None:
+            with self._lock:
+                if self._currency_converter is None:
+                    self._currency_converter = _load_currency_converter()
+                currency_converter = self._currency_converter
+        return currency_converter
 
 
 class CurrencySalaryConverter:
+    """
+    Thread-safe: conversions read a rates snapshot without locking,
+    locks only guard loading of the snapshot
+    """
+
+    def __init__(self, store_path: Optional[str] = CONVERSION_STORE_PATH):
+        """
+        :param store_path: SQLite file with conversions for closed months, `None` disables the store
+        """
+        self._store_path = store_path
+        self._lock = threading.Lock()
+        self.__rates: Optional[_Rates] = None
+
+    @property
+    def _rates(self) -> _Rates:
+        # Rates are downloaded on first conversion missing the store rather than on construction
+        rates = self.__rates
+        if rates is None:
+            with self._lock:
+                if self.__rates is None:
+                    self.__rates = self._load_rates()
+                rates = self.__rates
+        return rates
+
+    def refresh_rates(self):
+        """
+        Downloads fresh rates and swaps them in; conversions in progress finish with the previous snapshot
+        """
+        rates = self._load_rates(_load_currency_converter())
+        with self._lock:
+            self.__rates = rates
 
-    def __init__(self):
-        self._currency_converter = CurrencyConverter(FULL_DATA_CURRENCY_RATES_DATA_URL,
-                                                     fallback_on_missing_rate=True,
-                                                     # RUB rate could not be found in 2022-04 and later on,
-                                                     # thus these dates are considered wrong (out of known interval)
-                                                     fallback_on_wrong_date=False)
+    def _load_rates(self, currency_converter: Optional[CurrencyConverter] = None) -> _Rates:
+        store = ConversionStore(self._store_path, self.rates_version) if self._store_path else None
+        return _Rates(store, currency_converter)
+
+    @property
+    def rates_version(self) -> str:
+        """
+        Only months with final ECB rates are stored, so the snapshot changes meaningfully once a month.
+        Knowing the last closed month is enough to version it without downloading the rates
+        """
+        last_closed_month = add_months(date.today().replace(day=1), -1)
+        return f'{FULL_DATA_CURRENCY_RATES_DATA_URL}@{last_closed_month.strftime("%Y-%m")}'
 
     def convert(self, periods: List[EmploymentPeriod], new_currency: Currency) -> Dict[date, int]:
         salary = defaultdict(lambda: 0)
+        rates = self._rates
+        stored = self._load_stored(rates, periods, new_currency)
+        to_store = []
 
         for period in periods:
             for month in month_generator(period.begin, period.end):
-                converted = self._convert(period, new_currency, month)
+                converted = self._convert_stored(rates, period, new_currency, month, stored, to_store)
                 if converted is None or salary[month] is None:
                     salary[month] = None
                 else:
                     salary[month] += converted
 
+        self._save_stored(rates, new_currency, to_store)
+
         for key, value in salary.items():
             if value is not None:
                 salary[key] = round(value)
         return salary
 
-    def _convert(self, period: EmploymentPeriod, new_currency: Currency, dt: date):
+    def convert_series(self, periods: List[EmploymentPeriod], new_currency: Currency) -> StepSeries[int]:
+        """
+        Same values as `convert`, run-length encoded: periods already in `new_currency` are kept
+        as a single run instead of being expanded to months
+        """
+        periods = sorted(periods, key=lambda p: p.begin)
+        if any(previous.end >= current.begin for previous, current in zip(periods, periods[1:])):
+            # Concurrent jobs are summed month by month
+            return StepSeries.from_dict(self.convert(periods, new_currency))
+
+        series = StepSeries()
+        rates = self._rates
+        stored = self._load_stored(rates, periods, new_currency)
+        to_store = []
+
+        for period in periods:
+            if period.begin > period.end:
+                continue
+            if period.salary.currency == new_currency:
+                series.append_run(period.begin, last_month(period.begin, period.end), period.salary.amount)
+                continue
+
+            for month in month_generator(period.begin, period.end):
+                converted = self._convert_stored(rates, period, new_currency, month, stored, to_store)
+                series.append(month, round(converted) if converted is not None else None)
+
+        self._save_stored(rates, new_currency, to_store)
+        return series
+
+    def convert_at(self, periods: List[EmploymentPeriod], new_currency: Currency, dt: date) -> Optional[int]:
+        salary = 0
+        rates = self._rates
+        stored = self._load_stored(rates, periods, new_currency, dt, dt)
+        to_store = []
+
+        for period in periods:
+            converted = self._convert_stored(rates, period, new_currency, dt, stored, to_store)
+            if converted is None:
+                return None
+            salary += converted
+
+        self._save_stored(rates, new_currency, to_store)
+        return round(salary)
+
+    def unit_rates(self, currency: Currency, new_currency: Currency, months: List[date]) -> List[Optional[float]]:
+        """
+        Amount of `new_currency` for a single unit of `currency` at each of `months`.
+        Conversion is linear, so multiplying by these rates converts any amount
+        """
+        if not months:
+            return []
+
+        unit = EmploymentPeriod('', min(months), max(months), Salary(1, currency))
+        rates = self._rates
+        stored = self._load_stored(rates, [unit], new_currency)
+        to_store = []
+
+        result = [self._convert_stored(rates, unit, new_currency, month, stored, to_store) for month in months]
+
+        self._save_stored(rates, new_currency, to_store)
+        return result
+
+    @staticmethod
+    def _load_stored(rates: _Rates, periods: List[EmploymentPeriod], new_currency: Currency,
+                     begin: date = None, end: date = None):
+        if not rates.store or not periods:
+            return dict()
+        return rates.store.load(new_currency.name,
+                                {(p.salary.amount, p.salary.currency.name) for p in periods},
+                                begin or min(p.begin for p in periods),
+                                end or max(p.end for p in periods))
+
+    def _save_stored(self, rates: _Rates, new_currency: Currency, to_store):
+        # A snapshot swapped out by refresh_rates may be versioned differently from the current store.
+        # A save racing the swap itself can still leave its rows, they are never read and go on the next open
+        if rates.store and to_store and rates is self.__rates:
+            rates.store.save(new_currency.name, to_store)
+
+    def _convert_stored(self, rates: _Rates, period: EmploymentPeriod, new_currency: Currency, dt: date,
+                        stored, to_store):
+        if period.salary.currency == new_currency:
+            # No rates needed, also beyond the ECB bounds of the currency
+            return float(period.salary.amount)
+
+        key = (period.salary.amount, period.salary.currency.name, dt)
+        if key in stored:
+            return stored[key]
+
+        converted = self._convert(rates.currency_converter, period, new_currency, dt)
+        if converted is not None and rates.store and self._is_final(rates.currency_converter,
+                                                                     period.salary.currency, new_currency, dt):
+            stored[key] = converted
+            to_store.append((key, converted))
+        return converted
+
+    @staticmethod
+    def _is_final(currency_converter: CurrencyConverter, currency: Currency, new_currency: Currency,
+                  dt: date) -> bool:
+        """
+        Rates of a month are final once ECB has published data for a later month for both currencies.
+        Conventional USD/RUB rates are never stored, they are beyond RUB bounds
+        """
+        bounds = currency_converter.bounds
+        last_date = min(bounds[currency.name].last_date, bounds[new_currency.name].last_date)
+        return dt < last_date.replace(day=1)
+
+    def _convert(self, currency_converter: CurrencyConverter, period: EmploymentPeriod, new_currency: Currency,
+                 dt: date):
         try:
-            return self._currency_converter.convert(period.salary.amount,
-                                                    period.salary.currency.name,
-                                                    new_currency.name,
-                                                    dt)
+            return currency_converter.convert(period.salary.amount,
+                                              period.salary.currency.name,
+                                              new_currency.name,
+                                              dt)
         except RateNotFoundError:
             conventional_usd_rub_rate = self.get_conventional_usd_rub_rate(dt)
 
             if conventional_usd_rub_rate:
                 if new_currency == Currency.RUB:
-                    usd_amount = self._currency_converter.convert(period.salary.amount,
-                                                                  period.salary.currency.name,
-                                                                  Currency.USD.name,
-                                                                  dt)
+                    usd_amount = currency_converter.convert(period.salary.amount,
+                                                            period.salary.currency.name,
+                                                            Currency.USD.name,
+                                                            dt)
                     return conventional_usd_rub_rate * usd_amount
                 if period.salary.currency == Currency.RUB:
                     usd_amount = 1. / conventional_usd_rub_rate * period.salary.amount
-                    return self._currency_converter.convert(usd_amount,
-                                                            Currency.USD.name,
-                                                            new_currency.name,
-                                                            dt)
+                    return currency_converter.convert(usd_amount,
+                                                      Currency.USD.name,
+                                                      new_currency.name,
+                                                      dt)
             return None
 
     @staticmethod
@@ -0,0 +1,74 @@
+import sqlite3
+import threading
+from datetime import date
+from typing import Dict, Iterable, Set, Tuple
+
+__all__ = ['ConversionStore']
+
+StoredKey = Tuple[int, str, date]  # (amount, source currency, month)
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS conversions (
+    version TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    month TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (version, amount, source, target, month)
+)
+'''
+
+
+class ConversionStore:
+    """
+    On-disk store of converted monthly amounts for closed months.
+    Rows of any other data version are dropped on open, so a new rates snapshot invalidates the store.
+    Every thread uses its own connection, SQLite serializes concurrent writes
+    """
+
+    def __init__(self, path: str, version: str):
+        self._path = path
+        self._version = version
+        self._local = threading.local()
+        with self._connection:
+            self._connection.execute(SCHEMA)
+            self._connection.execute('DELETE FROM conversions WHERE version != ?', (version,))
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self._path, timeout=30)
+            self._local.connection = connection
+        return connection
+
+    def load(self, target: str, amounts: Set[Tuple[int, str]], begin: date, end: date) -> Dict[StoredKey, float]:
+        """
+        Single query for all (amount, source currency) pairs of an employee
+        """
+        if not amounts:
+            return dict()
+
+        amounts = sorted(amounts)
+        rows = self._connection.execute('SELECT amount, source, month, value FROM conversions '
+                                        'WHERE version = ? AND target = ? AND month BETWEEN ? AND ? AND ('
+                                        + ' OR '.join(['(amount = ? AND source = ?)'] * len(amounts)) + ')',
+                                        (self._version, target, begin.isoformat(), end.isoformat(),
+                                         *[value for pair in amounts for value in pair]))
+        return {(amount, source, date.fromisoformat(month)): value for amount, source, month, value in rows}
+
+    def save(self, target: str, values: Iterable[Tuple[StoredKey, float]]):
+        with self._connection:
+            self._connection.executemany('INSERT OR REPLACE INTO conversions VALUES (?, ?, ?, ?, ?, ?)',
+                                         [(self._version, amount, source, target, month.isoformat(), value)
+                                          for (amount, source, month), value in values])
+
+    def close(self):
+        """
+        Closes the connection of the calling thread
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
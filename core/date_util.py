@@ -16,3 +16,40 @@ def add_months(source_date: date, month_step: int) -> date:
     month = month % 12 + 1
     day = min(source_date.day, calendar.monthrange(year, month)[1])
     return date(year, month, day)
+
+
+def months_between(begin: date, end: date) -> int:
+    return (end.year - begin.year) * 12 + end.month - begin.month
+
+
+def nth_month(begin: date, months: int) -> date:
+    """
+    Date yielded by month_generator(begin, ...) after `months` steps.
+    The generator keeps a day clipped by a short month, so add_months(begin, months) differs for days 29-31
+    """
+    current = begin
+    while months > 0 and current.day > 28:
+        current = add_months(current, 1)
+        months -= 1
+    return add_months(current, months)
+
+
+def clip_to_months(begin: date, end: date, range_begin: date, range_end: date):
+    """
+    Narrows [begin, end] to [range_begin, range_end] keeping the month grid of month_generator(begin, end)
+    """
+    months = max(0, months_between(begin, range_begin))
+    clipped_begin = nth_month(begin, months)
+    if clipped_begin < range_begin:
+        clipped_begin = nth_month(begin, months + 1)
+    return clipped_begin, min(end, range_end)
+
+
+def last_month(begin: date, end: date) -> date:
+    """
+    Last date yielded by month_generator(begin, end)
+    """
+    months = months_between(begin, end)
+    if nth_month(begin, months) > end:
+        months -= 1
+    return nth_month(begin, months)
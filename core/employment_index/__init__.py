@@ -0,0 +1,3 @@
+from .index import EmploymentIndex, WorkforceIndex
+
+__all__ = ['EmploymentIndex', 'WorkforceIndex']
@@ -0,0 +1,142 @@
+from datetime import date
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+from ..models import EmploymentPeriod
+
+__all__ = ['EmploymentIndex', 'WorkforceIndex']
+
+T = TypeVar('T')
+
+
+class _Node(Generic[T]):
+    """
+    Centered interval tree node: keeps every interval containing `center`,
+    sorted by begin (ascending) and by end (descending) for early-stop scans
+    """
+
+    def __init__(self, center: date, intervals: List[Tuple[date, date, T]]):
+        self.center = center
+        self.by_begin = sorted(intervals, key=lambda x: x[0])
+        self.by_end = sorted(intervals, key=lambda x: x[1], reverse=True)
+        self.left: Optional[_Node[T]] = None
+        self.right: Optional[_Node[T]] = None
+
+
+class _IntervalTree(Generic[T]):
+
+    def __init__(self, intervals: Iterable[Tuple[date, date, T]]):
+        self._root = self._build(list(intervals))
+
+    def _build(self, intervals: List[Tuple[date, date, T]]) -> Optional[_Node[T]]:
+        if not intervals:
+            return None
+
+        endpoints = sorted(dt for begin, end, _ in intervals for dt in (begin, end))
+        center = endpoints[len(endpoints) // 2]
+
+        to_left = [x for x in intervals if x[1] < center]
+        to_right = [x for x in intervals if x[0] > center]
+        node = _Node(center, [x for x in intervals if x[0] <= center <= x[1]])
+        node.left = self._build(to_left)
+        node.right = self._build(to_right)
+        return node
+
+    def overlapping(self, begin: date, end: date) -> List[T]:
+        result: List[T] = []
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+
+            if end < node.center:
+                for interval_begin, _, value in node.by_begin:
+                    if interval_begin > end:
+                        break
+                    result.append(value)
+                stack.append(node.left)
+            elif begin > node.center:
+                for _, interval_end, value in node.by_end:
+                    if interval_end < begin:
+                        break
+                    result.append(value)
+                stack.append(node.right)
+            else:
+                result.extend(value for _, _, value in node.by_begin)
+                stack.append(node.left)
+                stack.append(node.right)
+        return result
+
+
+def _valid_periods(periods: Iterable[EmploymentPeriod]) -> List[EmploymentPeriod]:
+    # Periods ending before they begin have no months, as in month_generator
+    return [p for p in periods if p.begin <= p.end]
+
+
+class EmploymentIndex:
+    """
+    Interval index over employment periods of a single employee.
+    Point and range lookups take O(log n + k), where k is the number of matching periods.
+    Periods ending before they begin are left out
+    """
+
+    def __init__(self, periods: List[EmploymentPeriod]):
+        self._periods = _valid_periods(periods)
+        self._begin = min((p.begin for p in self._periods), default=None)
+        self._end = max((p.end for p in self._periods), default=None)
+        self._tree = _IntervalTree((p.begin, p.end, p) for p in self._periods)
+
+    def __len__(self):
+        return len(self._periods)
+
+    @property
+    def periods(self) -> List[EmploymentPeriod]:
+        return self._periods.copy()
+
+    @property
+    def begin(self) -> Optional[date]:
+        return self._begin
+
+    @property
+    def end(self) -> Optional[date]:
+        return self._end
+
+    def at(self, dt: date) -> List[EmploymentPeriod]:
+        return self.overlapping(dt, dt)
+
+    def overlapping(self, begin: date, end: date) -> List[EmploymentPeriod]:
+        return sorted(self._tree.overlapping(begin, end), key=lambda p: p.begin)
+
+
+class WorkforceIndex:
+    """
+    Interval index over employment periods of many employees
+    """
+
+    def __init__(self, periods: Dict[str, List[EmploymentPeriod]]):
+        periods = {employee: _valid_periods(employee_periods) for employee, employee_periods in periods.items()}
+        self._employees = {employee: EmploymentIndex(employee_periods)
+                           for employee, employee_periods in periods.items()}
+        self._tree = _IntervalTree((p.begin, p.end, (employee, p))
+                                   for employee, employee_periods in periods.items()
+                                   for p in employee_periods)
+
+    def __len__(self):
+        return len(self._employees)
+
+    @property
+    def employees(self) -> List[str]:
+        return list(self._employees.keys())
+
+    def employee(self, employee: str) -> EmploymentIndex:
+        return self._employees[employee]
+
+    def at(self, dt: date) -> Dict[str, List[EmploymentPeriod]]:
+        return self.overlapping(dt, dt)
+
+    def overlapping(self, begin: date, end: date) -> Dict[str, List[EmploymentPeriod]]:
+        result: Dict[str, List[EmploymentPeriod]] = dict()
+        for employee, period in sorted(self._tree.overlapping(begin, end), key=lambda x: x[1].begin):
+            result.setdefault(employee, []).append(period)
+        return result
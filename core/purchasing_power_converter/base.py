@@ -1,24 +1,51 @@
 from datetime import date
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from ..date_util import months_between
+from ..step_series import StepSeries
 
 
 class BasePurchasingPowerSalaryConverter:
 
-    def convert(self, salary: Dict[date, int]) -> Dict[date, int]:
+    def convert(self, salary: Dict[date, int], base_month: Optional[date] = None) -> Dict[date, int]:
         start_month = min(salary.keys()).replace(day=1)
         end_month = max(salary.keys()).replace(day=1)
-        changes = self.get_purchasing_power_change(start_month, end_month)
+        base_month = base_month.replace(day=1) if base_month else start_month
+        changes = self.get_purchasing_power_change(base_month, end_month)
 
         result: Dict[date, int] = dict()
 
-        for idx, (month, amount) in enumerate(sorted(salary.items())):
+        # Offsets are counted by calendar months, the salary may have gaps or several dates within a month
+        for month, amount in sorted(salary.items()):
+            offset = months_between(base_month, month)
             try:
-                value_change = changes[idx]
+                value_change = changes[offset] if offset >= 0 else None
                 result[month] = amount * value_change
             except (IndexError, TypeError):
                 result[month] = None  # No more data, return truthy None
 
         return result
 
+    def convert_series(self, salary: StepSeries, base_month: Optional[date] = None) -> StepSeries:
+        # Purchasing power changes every month, so the result is monthly anyway
+        return StepSeries.from_dict(self.convert(salary.to_dict(), base_month))
+
+    def convert_at(self, amount: Optional[int], base_month: date, month: date) -> Optional[float]:
+        factor = self.get_purchasing_power_factor(base_month, month)
+        if amount is None or factor is None:
+            return None
+        return amount * factor
+
+    def get_purchasing_power_factor(self, base_month: date, month: date) -> Optional[float]:
+        """
+        Purchasing power change from `base_month` to `month`, `None` if statistics do not cover it.
+        Converters keeping cumulative statistics override it to skip building the whole change list
+        """
+        offset = months_between(base_month, month)
+        if offset < 0:
+            return None
+        changes = self.get_purchasing_power_change(base_month.replace(day=1), month.replace(day=1))
+        return changes[offset] if offset < len(changes) else None
+
     def get_purchasing_power_change(self, base_month: date, future_month: date) -> List[int]:
         raise NotImplemented("")
@@ -1,14 +1,71 @@
+import threading
 from datetime import date
-from typing import List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 
-from .data import get_value_changes, update_stats
+from .data import get_value_changes, load_from_file, update_stats
 from ..base import BasePurchasingPowerSalaryConverter
+from ...date_util import month_generator, months_between
+
+
+class _Statistics:
+    """
+    Read-only statistics snapshot along with cumulative changes since the first known month,
+    so a change between any two months is a single division
+    """
+
+    def __init__(self, month_to_change: Dict[date, float]):
+        self.month_to_change: Mapping[date, float] = MappingProxyType(month_to_change)
+        self._first = min(month_to_change.keys(), default=None)
+
+        # _products[i] is the change from the first known month to the i-th month after it
+        self._products = [1.]
+        if month_to_change:
+            for month in month_generator(self._first, max(month_to_change.keys())):
+                self._products.append(self._products[-1] * month_to_change.get(month, 1))
+
+    def factor(self, base_month: date, month: date) -> Optional[float]:
+        offset = months_between(base_month, month)
+        if offset == 0:
+            return 1.
+        if offset < 0 or not self.month_to_change or months_between(self._first, month) >= len(self._products):
+            return None  # Same as get_value_changes: no data past the month after the last known one
+        return self._cumulative(month) / self._cumulative(base_month)
+
+    def _cumulative(self, month: date) -> float:
+        return self._products[max(0, months_between(self._first, month))]
 
 
 class RubPurchasingPowerSalaryConverter(BasePurchasingPowerSalaryConverter):
+    """
+    Thread-safe: statistics are kept in memory as a read-only snapshot, which `refresh` replaces as a whole
+    """
 
     def __init__(self):
-        update_stats()
+        # Statistics are refreshed on first use, so that importing the converter never touches the network
+        self._lock = threading.Lock()
+        self._statistics: Optional[_Statistics] = None
+
+    def refresh(self):
+        with self._lock:
+            self._statistics = self._load()
 
     def get_purchasing_power_change(self, base_month: date, future_month: date) -> List[int]:
-        return get_value_changes(base_month, future_month)
+        return get_value_changes(base_month, future_month, month_to_change=self._get_statistics().month_to_change)
+
+    def get_purchasing_power_factor(self, base_month: date, month: date) -> Optional[float]:
+        return self._get_statistics().factor(base_month, month)
+
+    def _get_statistics(self) -> _Statistics:
+        statistics = self._statistics
+        if statistics is None:
+            with self._lock:
+                if self._statistics is None:
+                    self._statistics = self._load()
+                statistics = self._statistics
+        return statistics
+
+    @staticmethod
+    def _load() -> _Statistics:
+        update_stats()
+        return _Statistics(load_from_file(1))
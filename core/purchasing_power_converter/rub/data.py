@@ -1,10 +1,16 @@
 import datetime
 import json
+import os
+import tempfile
+from contextlib import contextmanager
 from itertools import tee
 from pprint import pprint
-from typing import Dict
+from typing import Dict, Mapping
 
-import requests
+try:
+    import fcntl
+except ImportError:  # Windows: no inter-process lock, writes are still atomic
+    fcntl = None
 
 from core.date_util import month_generator, add_months
 
@@ -17,9 +23,12 @@ VALUE_AMOUNT = 1_000_000
 
 JSON_NAME = 'core/purchasing_power_converter/rub/purchasing_power_change_to_next_month_step_%d.json'
 JSON_DATE_FMT = '%Y-%m-%d'
+LOCK_NAME = JSON_NAME + '.lock'
 
 
 def get_available_months():
+    import requests  # Loaded lazily: HTTP client is only needed when statistics are refreshed
+
     r = requests.post(ROOT_URL + 'get-data-json',
                       json={
                           'country': 'russia'
@@ -45,6 +54,8 @@ def pairwise(iterable):
 
 
 def get_value_change(start_month: datetime.date, end_month: datetime.date):
+    import requests
+
     r = requests.post(ROOT_URL + 'calculate-inflation-value-json',
                       json={
                           'country': 'russia',
@@ -59,6 +70,19 @@ def get_value_change(start_month: datetime.date, end_month: datetime.date):
 
 
 def update_stats(months_step: int = 1):
+    # Only one process refreshes, the others wait for it and reuse the file it has written
+    requested_at = datetime.datetime.now()
+    with refresh_lock(months_step) as lock_file:
+        if is_refreshed_since(lock_file, requested_at):
+            print('Purchasing power statistics database is up to date')
+            return {k.strftime(JSON_DATE_FMT): v for k, v in load_from_file(months_step).items()}
+
+        result = _update_stats(months_step)
+        mark_refreshed(lock_file)
+        return result
+
+
+def _update_stats(months_step: int):
     print('Updating purchasing power statistics database...')
 
     month_to_change = load_from_file(months_step)
@@ -82,6 +106,34 @@ def update_stats(months_step: int = 1):
     return dump_to_file(month_to_change, months_step)
 
 
+@contextmanager
+def refresh_lock(months_step: int):
+    with open(LOCK_NAME % months_step, 'a+') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield lock_file
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def is_refreshed_since(lock_file, requested_at: datetime.datetime) -> bool:
+    lock_file.seek(0)
+    try:
+        refreshed_at = datetime.datetime.fromisoformat(lock_file.read().strip())
+    except ValueError:
+        return False
+    return refreshed_at >= requested_at
+
+
+def mark_refreshed(lock_file):
+    lock_file.seek(0)
+    lock_file.truncate()
+    lock_file.write(datetime.datetime.now().isoformat())
+    lock_file.flush()
+
+
 def load_from_file(months_step: int) -> Dict[datetime.date, float]:
     try:
         with open(JSON_NAME % months_step, 'rb') as f:
@@ -95,13 +147,24 @@ def load_from_file(months_step: int) -> Dict[datetime.date, float]:
 def dump_to_file(month_to_change: Dict[datetime.date, float], months_step: int):
     str_to_change = {k.strftime(JSON_DATE_FMT): v for k, v in month_to_change.items()}
 
-    with open(JSON_NAME % months_step, 'w') as f:
-        json.dump(str_to_change, f, sort_keys=True, indent=4, separators=(',', ': '))
+    # Write to a temporary file and rename it, so readers never see a half-written file
+    file_name = JSON_NAME % months_step
+    fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(file_name), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(str_to_change, f, sort_keys=True, indent=4, separators=(',', ': '))
+        os.chmod(tmp_name, 0o644)  # mkstemp creates owner-only files
+        os.replace(tmp_name, file_name)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
     return str_to_change
 
 
-def get_value_changes(start_month: datetime.date, end_month: datetime.date, months_step: int = 1):
-    month_to_change = load_from_file(months_step)
+def get_value_changes(start_month: datetime.date, end_month: datetime.date, months_step: int = 1,
+                      month_to_change: Mapping[datetime.date, float] = None):
+    if month_to_change is None:
+        month_to_change = load_from_file(months_step)
 
     latest_month = min(max(month_to_change.keys()), end_month)
 
@@ -1,11 +1,14 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from ..currency_converter import CurrencySalaryConverter
+from ..date_util import clip_to_months
+from ..employment_index import EmploymentIndex
 from ..models import Currency, EmploymentPeriod
 from ..purchasing_power_converter.base import BasePurchasingPowerSalaryConverter
+from ..step_series import StepSeries
 
 
 @dataclass
@@ -14,7 +17,17 @@ class ConvertedSalary:
     salaries_purchasing_power: Dict[date, Dict[Currency, int]]
 
 
+@dataclass
+class ConvertedSeries:
+    salaries: Dict[Currency, StepSeries]
+    salaries_purchasing_power: Dict[Currency, StepSeries]
+
+
 class SalaryCalculator:
+    """
+    Keeps no state of its own between calls, so it is thread-safe as long as the converters are.
+    Both bundled converters are
+    """
 
     def __init__(self,
                  currency_converter: CurrencySalaryConverter,
@@ -25,13 +38,81 @@ class SalaryCalculator:
     def convert(self,
                 periods: List[EmploymentPeriod],
                 currencies: List[Currency],
-                currencies_purchasing_power: List[Currency]) -> ConvertedSalary:
+                currencies_purchasing_power: List[Currency],
+                base_month: Optional[date] = None) -> ConvertedSalary:
 
         salaries = self._get_salary_in_currencies(periods, currencies)
-        salaries_purchasing_power = self._get_salary_in_purchasing_power(periods, currencies_purchasing_power)
+        salaries_purchasing_power = self._get_salary_in_purchasing_power(periods, currencies_purchasing_power,
+                                                                         base_month)
 
         return ConvertedSalary(salaries, salaries_purchasing_power)
 
+    def convert_series(self,
+                       periods: List[EmploymentPeriod],
+                       currencies: List[Currency],
+                       currencies_purchasing_power: List[Currency],
+                       base_month: Optional[date] = None) -> ConvertedSeries:
+        """
+        Same as `convert`, but keeps run-length encoded series, expanding only rate-dependent values to months
+        """
+        salaries = {currency: self._currency_converter.convert_series(periods, currency)
+                    for currency in currencies}
+
+        salaries_purchasing_power = dict()
+        for currency in currencies_purchasing_power:
+            converter = self._purchasing_power_converters.get(currency)
+
+            if converter:
+                series = salaries.get(currency) or self._currency_converter.convert_series(periods, currency)
+                salaries_purchasing_power[currency] = converter.convert_series(series, base_month)
+
+        return ConvertedSeries(salaries, salaries_purchasing_power)
+
+    def convert_at(self,
+                   index: EmploymentIndex,
+                   dt: date,
+                   currencies: List[Currency],
+                   currencies_purchasing_power: List[Currency]) -> ConvertedSalary:
+        """
+        Salary at a single date, summed over concurrent periods.
+        Purchasing power is measured since the first employment in the index
+        """
+        periods = index.at(dt)
+        if not periods:
+            return ConvertedSalary(dict(), dict())
+
+        salaries = {dt: {currency: self._currency_converter.convert_at(periods, currency, dt)
+                         for currency in currencies}}
+
+        salaries_purchasing_power: Dict[date, Dict[Currency, int]] = defaultdict(dict)
+        for currency in currencies_purchasing_power:
+            converter = self._purchasing_power_converters.get(currency)
+
+            if converter:
+                amount = self._currency_converter.convert_at(periods, currency, dt)
+                salaries_purchasing_power[dt][currency] = converter.convert_at(amount, index.begin, dt)
+
+        return ConvertedSalary(salaries, salaries_purchasing_power)
+
+    def convert_between(self,
+                        index: EmploymentIndex,
+                        begin: date,
+                        end: date,
+                        currencies: List[Currency],
+                        currencies_purchasing_power: List[Currency]) -> ConvertedSalary:
+        """
+        Monthly salary within [begin, end] only, without expanding periods outside of it
+        """
+        periods = []
+        for period in index.overlapping(begin, end):
+            clipped_begin, clipped_end = clip_to_months(period.begin, period.end, begin, end)
+            if clipped_begin <= clipped_end:
+                periods.append(EmploymentPeriod(period.company, clipped_begin, clipped_end, period.salary))
+
+        if not periods:
+            return ConvertedSalary(dict(), dict())
+        return self.convert(periods, currencies, currencies_purchasing_power, base_month=index.begin)
+
     def _get_salary_in_currencies(self, periods, currencies):
         result: Dict[date, Dict[Currency, int]] = defaultdict(dict)
 
@@ -42,7 +123,7 @@ class SalaryCalculator:
                 result[dt].update({currency: money_amount})
         return result
 
-    def _get_salary_in_purchasing_power(self, periods, currencies):
+    def _get_salary_in_purchasing_power(self, periods, currencies, base_month=None):
         salary_in_currencies = self._get_salary_in_currencies(periods, currencies)
 
         result: Dict[date, Dict[Currency, int]] = defaultdict(dict)
@@ -53,7 +134,7 @@ class SalaryCalculator:
             if converter:
                 converted_salary = {dt: salary.get(currency) for dt, salary in salary_in_currencies.items()}
 
-                salaries_adjusted_for_purchasing_power = converter.convert(converted_salary)
+                salaries_adjusted_for_purchasing_power = converter.convert(converted_salary, base_month)
 
                 for dt, money_amount in salaries_adjusted_for_purchasing_power.items():
                     result[dt].update({currency: money_amount})
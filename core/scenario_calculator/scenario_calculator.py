@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+
+from ..currency_converter import CurrencySalaryConverter
+from ..date_util import month_generator, months_between
+from ..models import Currency, EmploymentPeriod
+from ..purchasing_power_converter.base import BasePurchasingPowerSalaryConverter
+
+BASELINE = 'baseline'
+
+
+@dataclass
+class ScenarioResult:
+    months: List[date]
+    salaries: List[Optional[int]]
+    salaries_usd: List[Optional[int]]
+    salaries_purchasing_power: List[Optional[float]]
+
+    @property
+    def purchasing_power_change(self) -> Optional[float]:
+        """
+        Last known salary adjusted for purchasing power relative to the first one
+        """
+        known = [amount for amount in self.salaries_purchasing_power if amount]
+        return known[-1] / known[0] if known else None
+
+    @property
+    def usd_change(self) -> Optional[float]:
+        known = [amount for amount in self.salaries_usd if amount]
+        return known[-1] / known[0] if known else None
+
+    def keeps_purchasing_power(self, until: date, tolerance: float = 0.0) -> bool:
+        """
+        Whether salary adjusted for purchasing power never drops below the first month's one until `until`
+        """
+        known = [amount for month, amount in zip(self.months, self.salaries_purchasing_power)
+                 if month <= until and amount is not None]
+        return bool(known) and min(known) >= known[0] * (1 - tolerance)
+
+
+class ScenarioCalculator:
+    """
+    Evaluates many hypothetical raise schedules against a baseline.
+    Rates and purchasing power factors are resolved once for the whole batch,
+    every schedule is then a plain multiplication over the same monthly grid
+    """
+
+    def __init__(self,
+                 currency_converter: CurrencySalaryConverter,
+                 purchasing_power_converters: Dict[Currency, BasePurchasingPowerSalaryConverter]):
+        self._currency_converter = currency_converter
+        self._purchasing_power_converters = purchasing_power_converters
+
+    def evaluate(self,
+                 baseline: List[EmploymentPeriod],
+                 variants: Dict[str, List[EmploymentPeriod]],
+                 currency: Currency = Currency.RUB) -> Dict[str, ScenarioResult]:
+        """
+        :return: results by scenario name, baseline is under `BASELINE`.
+        Purchasing power is measured in `currency` since the first month of the baseline
+        """
+        scenarios = {BASELINE: baseline, **variants}
+        all_periods = [period for periods in scenarios.values() for period in periods]
+
+        # Same month semantics as CurrencySalaryConverter.convert: every period is paid on its own days
+        months = sorted({month for period in all_periods for month in month_generator(period.begin, period.end)})
+        base_month = min(p.begin for p in baseline).replace(day=1)
+
+        source_currencies = {p.salary.currency for p in all_periods}
+        rates = {new_currency: {source: self._unit_rates(source, new_currency, months)
+                                for source in source_currencies}
+                 for new_currency in {currency, Currency.USD}}
+        purchasing_power = self._purchasing_power_factors(currency, base_month, months)
+
+        return {name: self._evaluate(periods, months, rates, currency, purchasing_power)
+                for name, periods in scenarios.items()}
+
+    def _unit_rates(self, source: Currency, new_currency: Currency, months: List[date]) -> List[Optional[float]]:
+        if source == new_currency:
+            return [1.] * len(months)
+        return self._currency_converter.unit_rates(source, new_currency, months)
+
+    def _purchasing_power_factors(self, currency: Currency, base_month: date,
+                                  months: List[date]) -> List[Optional[float]]:
+        converter = self._purchasing_power_converters.get(currency)
+        if not converter:
+            return [None] * len(months)
+
+        if not months:
+            return []
+
+        changes = converter.get_purchasing_power_change(base_month, months[-1].replace(day=1))
+        offsets = [months_between(base_month, month) for month in months]
+        return [changes[offset] if 0 <= offset < len(changes) else None for offset in offsets]
+
+    @staticmethod
+    def _evaluate(periods: List[EmploymentPeriod],
+                  months: List[date],
+                  rates: Dict[Currency, Dict[Currency, List[Optional[float]]]],
+                  currency: Currency,
+                  purchasing_power: List[Optional[float]]) -> ScenarioResult:
+        nominal = _nominal_by_currency(periods, months)
+
+        converted = dict()
+        for new_currency, source_rates in rates.items():
+            total: List[Optional[float]] = [0.] * len(months)
+            for source, amounts in nominal.items():
+                for idx, (amount, rate) in enumerate(zip(amounts, source_rates[source])):
+                    if amount is None or total[idx] is None:
+                        continue
+                    total[idx] = None if rate is None else total[idx] + amount * rate
+            converted[new_currency] = total
+
+        active = [any(amounts[idx] is not None for amounts in nominal.values()) for idx in range(len(months))]
+        salaries = [round(x) if x is not None and is_active else None
+                    for x, is_active in zip(converted[currency], active)]
+        salaries_usd = [round(x) if x is not None and is_active else None
+                        for x, is_active in zip(converted[Currency.USD], active)]
+        salaries_purchasing_power = [amount * factor if amount is not None and factor is not None else None
+                                     for amount, factor in zip(salaries, purchasing_power)]
+
+        return ScenarioResult(months, salaries, salaries_usd, salaries_purchasing_power)
+
+
+def _nominal_by_currency(periods: List[EmploymentPeriod],
+                         months: List[date]) -> Dict[Currency, List[Optional[int]]]:
+    """
+    Nominal amounts per currency at every date of the grid, summed over concurrent periods.
+    `None` marks dates no period of that currency is paid at
+    """
+    positions = {month: idx for idx, month in enumerate(months)}
+    nominal: Dict[Currency, List[Optional[int]]] = dict()
+
+    for period in periods:
+        amounts = nominal.setdefault(period.salary.currency, [None] * len(months))
+        for month in month_generator(period.begin, period.end):
+            idx = positions[month]
+            amounts[idx] = (amounts[idx] or 0) + period.salary.amount
+    return nominal
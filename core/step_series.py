@@ -0,0 +1,102 @@
+from bisect import bisect_right
+from datetime import date
+from typing import Dict, Generator, Generic, List, NamedTuple, Optional, Tuple, TypeVar
+
+from core.date_util import add_months, month_generator
+
+__all__ = ['Run', 'StepSeries']
+
+T = TypeVar('T')
+
+
+class Run(NamedTuple):
+    begin: date
+    end: date  # Last month of the run, inclusive
+    value: Optional[float]
+
+
+class StepSeries(Generic[T]):
+    """
+    Run-length encoded monthly series: a value is stored once for consecutive months it holds for
+    """
+
+    def __init__(self):
+        self._begins: List[date] = []
+        self._ends: List[date] = []
+        self._values: List[Optional[T]] = []
+
+    @classmethod
+    def from_dict(cls, monthly: Dict[date, Optional[T]]) -> 'StepSeries[T]':
+        series = cls()
+        for month, value in sorted(monthly.items()):
+            series.append(month, value)
+        return series
+
+    def __len__(self):
+        return len(self._values)
+
+    def __bool__(self):
+        return bool(self._values)
+
+    @property
+    def runs(self) -> List[Run]:
+        return [Run(*run) for run in zip(self._begins, self._ends, self._values)]
+
+    @property
+    def begin(self) -> date:
+        return self._begins[0]
+
+    @property
+    def end(self) -> date:
+        return self._ends[-1]
+
+    def append(self, month: date, value: Optional[T]):
+        """
+        Adds a single month, extending the last run when the month follows it with the same value
+        """
+        if self._values and self._values[-1] == value and add_months(self._ends[-1], 1) == month:
+            self._ends[-1] = month
+        else:
+            self.append_run(month, month, value)
+
+    def append_run(self, begin: date, end: date, value: Optional[T]):
+        if self._ends and begin <= self._ends[-1]:
+            raise ValueError(f'Run {begin}..{end} overlaps previous run ending {self._ends[-1]}')
+
+        if self._values and self._values[-1] == value and add_months(self._ends[-1], 1) == begin:
+            self._ends[-1] = end
+        else:
+            self._begins.append(begin)
+            self._ends.append(end)
+            self._values.append(value)
+
+    def value_at(self, month: date) -> Optional[T]:
+        idx = bisect_right(self._begins, month) - 1
+        if idx < 0 or month > self._ends[idx]:
+            return None
+        return self._values[idx]
+
+    def items(self) -> Generator[Tuple[date, Optional[T]], None, None]:
+        for begin, end, value in zip(self._begins, self._ends, self._values):
+            for month in month_generator(begin, end):
+                yield month, value
+
+    def to_dict(self) -> Dict[date, Optional[T]]:
+        return dict(self.items())
+
+    def change_points(self) -> Tuple[List[date], List[T]]:
+        """
+        Points of a step plot with `where='pre'`, equivalent to plotting every month of the series.
+        Runs without value are skipped
+        """
+        months: List[date] = []
+        amounts: List[T] = []
+        for begin, end, value in zip(self._begins, self._ends, self._values):
+            if value is None:
+                continue
+            if not months:
+                months.append(begin)
+                amounts.append(value)
+            months.append(end)
+            amounts.append(value)
+        return months, amounts
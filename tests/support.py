@@ -0,0 +1,27 @@
+import importlib.util
+import unittest
+from unittest import mock
+
+HAS_CURRENCY_CONVERTER = importlib.util.find_spec('currency_converter') is not None
+
+
+def bundled_currency_converter():
+    # Rates bundled with the package, so tests do not download anything
+    from currency_converter import CurrencyConverter
+    return CurrencyConverter(fallback_on_missing_rate=True, fallback_on_wrong_date=False)
+
+
+@unittest.skipUnless(HAS_CURRENCY_CONVERTER, 'CurrencyConverter is not installed')
+class OfflineConvertersTestCase(unittest.TestCase):
+    """
+    Converters use bundled currency rates and the purchasing power statistics already saved in the repo.
+    Converter modules import CurrencyConverter, so tests import them inside test methods
+    """
+
+    def setUp(self):
+        patches = [mock.patch('core.currency_converter.converters._load_currency_converter',
+                              bundled_currency_converter),
+                   mock.patch('core.purchasing_power_converter.rub.converter.update_stats', lambda: None)]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
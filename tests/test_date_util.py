@@ -0,0 +1,51 @@
+import calendar
+import random
+import unittest
+from datetime import date
+
+from core.date_util import add_months, clip_to_months, last_month, month_generator, nth_month
+
+SEED = 26
+CASES = 2000
+FAR_END = date(2030, 12, 31)
+
+
+def random_date(rnd: random.Random) -> date:
+    # Days 28-31 are where month_generator and add_months disagree, so they are picked as often as all others
+    year, month = rnd.randint(2012, 2020), rnd.randint(1, 12)
+    day = rnd.choice([rnd.randint(1, 27), 28, 29, 30, 31])
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+class DateUtilTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rnd = random.Random(SEED)
+
+    def test_nth_month_matches_month_generator(self):
+        for _ in range(CASES // 10):
+            begin = random_date(self.rnd)
+            for months, dt in enumerate(month_generator(begin, FAR_END)):
+                self.assertEqual(dt, nth_month(begin, months), (begin, months))
+
+    def test_nth_month_keeps_clipped_day(self):
+        self.assertEqual(date(2019, 3, 28), nth_month(date(2019, 1, 31), 2))
+        self.assertEqual(date(2019, 3, 31), add_months(date(2019, 1, 31), 2))
+
+    def test_clip_to_months_matches_month_generator(self):
+        for _ in range(CASES):
+            begin, end = sorted([random_date(self.rnd), random_date(self.rnd)])
+            range_begin, range_end = sorted([random_date(self.rnd), random_date(self.rnd)])
+
+            expected = [dt for dt in month_generator(begin, end) if range_begin <= dt <= range_end]
+            clipped = list(month_generator(*clip_to_months(begin, end, range_begin, range_end)))
+            self.assertEqual(expected, clipped, (begin, end, range_begin, range_end))
+
+    def test_last_month_matches_month_generator(self):
+        for _ in range(CASES):
+            begin, end = sorted([random_date(self.rnd), random_date(self.rnd)])
+            self.assertEqual(list(month_generator(begin, end))[-1], last_month(begin, end), (begin, end))
+
+
+if __name__ == '__main__':
+    unittest.main()
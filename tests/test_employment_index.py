@@ -0,0 +1,82 @@
+import random
+import unittest
+from datetime import date, timedelta
+from typing import List
+
+from core.employment_index import EmploymentIndex, WorkforceIndex
+from core.models import Currency, EmploymentPeriod, Salary
+
+SEED = 26
+EMPLOYEES = 20
+PERIODS_PER_EMPLOYEE = 15
+QUERIES = 300
+FIRST_DAY = date(2010, 1, 1)
+DAYS = 10 * 365
+
+
+def random_period(rnd: random.Random, company: str) -> EmploymentPeriod:
+    begin = FIRST_DAY + timedelta(days=rnd.randrange(DAYS))
+    # Some periods end before they begin, the indexes leave them out
+    end = begin + timedelta(days=rnd.randint(-60, 3 * 365))
+    return EmploymentPeriod(company, begin, end, Salary(rnd.randint(1, 100) * 1000, Currency.RUB))
+
+
+def brute_force_overlapping(periods: List[EmploymentPeriod], begin: date, end: date) -> List[EmploymentPeriod]:
+    return [p for p in periods if p.begin <= p.end and p.begin <= end and begin <= p.end]
+
+
+def ids(periods: List[EmploymentPeriod]) -> List[int]:
+    return sorted(map(id, periods))
+
+
+class EmploymentIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rnd = random.Random(SEED)
+        self.periods = {f'employee {idx}': [random_period(self.rnd, f'company {idx}')
+                                            for _ in range(PERIODS_PER_EMPLOYEE)]
+                        for idx in range(EMPLOYEES)}
+
+    def _random_range(self):
+        begin = FIRST_DAY + timedelta(days=self.rnd.randrange(-100, DAYS + 100))
+        return begin, begin + timedelta(days=self.rnd.randint(0, 400))
+
+    def test_employment_index_matches_brute_force(self):
+        for employee_periods in self.periods.values():
+            index = EmploymentIndex(employee_periods)
+            valid = [p for p in employee_periods if p.begin <= p.end]
+
+            self.assertEqual(len(valid), len(index))
+            self.assertEqual(min(p.begin for p in valid), index.begin)
+            self.assertEqual(max(p.end for p in valid), index.end)
+
+            for _ in range(QUERIES // 10):
+                begin, end = self._random_range()
+                overlapping = index.overlapping(begin, end)
+                self.assertEqual(ids(brute_force_overlapping(employee_periods, begin, end)), ids(overlapping))
+                self.assertEqual(sorted(p.begin for p in overlapping), [p.begin for p in overlapping])
+                self.assertEqual(ids(brute_force_overlapping(employee_periods, begin, begin)), ids(index.at(begin)))
+
+    def test_workforce_index_matches_brute_force(self):
+        index = WorkforceIndex(self.periods)
+
+        for _ in range(QUERIES):
+            begin, end = self._random_range()
+            expected = {employee: ids(brute_force_overlapping(employee_periods, begin, end))
+                        for employee, employee_periods in self.periods.items()}
+            expected = {employee: periods for employee, periods in expected.items() if periods}
+            actual = {employee: ids(periods) for employee, periods in index.overlapping(begin, end).items()}
+            self.assertEqual(expected, actual)
+
+    def test_only_inverted_periods(self):
+        inverted = EmploymentPeriod('Zavod, LLC', date(2020, 5, 1), date(2020, 4, 30), Salary(1000, Currency.RUB))
+
+        index = EmploymentIndex([inverted])
+        self.assertEqual(0, len(index))
+        self.assertIsNone(index.begin)
+        self.assertEqual([], index.at(date(2020, 5, 1)))
+        self.assertEqual({}, WorkforceIndex({'employee': [inverted]}).at(date(2020, 5, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
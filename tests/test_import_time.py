@@ -0,0 +1,46 @@
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Stats-only startup must stay well below the time matplotlib alone takes to import
+STATS_IMPORT_BUDGET_SECONDS = 0.5
+HEAVY_MODULES = ['matplotlib', 'requests']
+
+CHECK_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+%s
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'loaded': [m for m in %r if m in sys.modules]}))
+'''
+
+
+def _import_in_subprocess(imports: str) -> dict:
+    output = subprocess.check_output([sys.executable, '-c', CHECK_SCRIPT % (imports, HEAVY_MODULES)], cwd=ROOT)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+class ImportTimeTest(unittest.TestCase):
+
+    def test_cli_does_not_load_heavy_modules(self):
+        result = _import_in_subprocess("import cli\ncli.build_parser().parse_args(['stats'])")
+
+        self.assertEqual([], result['loaded'])
+        self.assertLess(result['elapsed'], STATS_IMPORT_BUDGET_SECONDS)
+
+    @unittest.skipUnless(importlib.util.find_spec('currency_converter'), 'CurrencyConverter is not installed')
+    def test_stats_command_does_not_load_heavy_modules(self):
+        result = _import_in_subprocess('import cli\nimport core.yearly_calculator.yearly_stats\n'
+                                       'import core.purchasing_power_converter')
+
+        self.assertEqual([], result['loaded'])
+        self.assertLess(result['elapsed'], STATS_IMPORT_BUDGET_SECONDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
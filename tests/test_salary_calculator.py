@@ -0,0 +1,83 @@
+import random
+import unittest
+from datetime import date
+
+from core.date_util import add_months, month_generator
+from core.employment_index import EmploymentIndex
+from core.models import Currency, EmploymentPeriod, Salary
+from tests.support import OfflineConvertersTestCase
+
+SEED = 26
+RANGES = 40
+
+CURRENCIES = [Currency.RUB]
+
+# Gaps between jobs, a job starting on the 31st and one ending before it begins
+GAPPED_HISTORY = [
+    EmploymentPeriod('Zavod, LLC', date(2014, 3, 1), date(2015, 3, 31), Salary(40000, Currency.RUB)),
+    EmploymentPeriod('Zavod, LLC', date(2016, 4, 1), date(2018, 3, 31), Salary(50000, Currency.RUB)),
+    EmploymentPeriod('Fabrika, LLC', date(2018, 8, 31), date(2019, 5, 30), Salary(60000, Currency.RUB)),
+    EmploymentPeriod('Fabrika, LLC', date(2019, 7, 29), date(2020, 2, 28), Salary(65000, Currency.RUB)),
+    EmploymentPeriod('Fabrika, LLC', date(2020, 5, 1), date(2020, 4, 30), Salary(70000, Currency.RUB)),
+]
+
+
+class SalaryCalculatorTest(OfflineConvertersTestCase):
+
+    def setUp(self):
+        super().setUp()
+        from core.currency_converter import CurrencySalaryConverter
+        from core.purchasing_power_converter.rub.converter import RubPurchasingPowerSalaryConverter
+        from core.salary_calculator.salary_calculator import SalaryCalculator
+
+        self.calculator = SalaryCalculator(CurrencySalaryConverter(None),
+                                           {Currency.RUB: RubPurchasingPowerSalaryConverter()})
+        self.index = EmploymentIndex(GAPPED_HISTORY)
+        self.rnd = random.Random(SEED)
+
+    def _random_ranges(self):
+        yield date(2015, 1, 1), date(2016, 12, 31)
+        for _ in range(RANGES):
+            begin = add_months(date(2013, 12, 1), self.rnd.randrange(80)).replace(day=self.rnd.randint(1, 28))
+            yield begin, add_months(begin, self.rnd.randrange(40)).replace(day=self.rnd.randint(1, 28))
+
+    def test_convert_between_matches_convert_at(self):
+        for begin, end in self._random_ranges():
+            between = self.calculator.convert_between(self.index, begin, end, CURRENCIES, CURRENCIES)
+
+            for month, salary in between.salaries.items():
+                self.assertTrue(begin <= month <= end, (begin, end, month))
+                at = self.calculator.convert_at(self.index, month, CURRENCIES, CURRENCIES)
+                self.assertEqual(at.salaries[month], salary, month)
+                self.assertAlmostEqual(at.salaries_purchasing_power[month][Currency.RUB],
+                                       between.salaries_purchasing_power[month][Currency.RUB], msg=month)
+
+    def test_convert_between_matches_clipped_convert(self):
+        converted = self.calculator.convert(GAPPED_HISTORY, CURRENCIES, CURRENCIES, base_month=self.index.begin)
+
+        for begin, end in self._random_ranges():
+            between = self.calculator.convert_between(self.index, begin, end, CURRENCIES, CURRENCIES)
+
+            self.assertEqual({month: salary for month, salary in converted.salaries.items() if begin <= month <= end},
+                             dict(between.salaries), (begin, end))
+            self.assertEqual({month: salary for month, salary in converted.salaries_purchasing_power.items()
+                              if begin <= month <= end},
+                             dict(between.salaries_purchasing_power), (begin, end))
+
+    def test_convert_at_grid_of_month_generator(self):
+        period = GAPPED_HISTORY[2]
+        months = list(month_generator(period.begin, period.end))
+
+        self.assertEqual(date(2019, 3, 28), months[7])
+        for month in months:
+            at = self.calculator.convert_at(self.index, month, CURRENCIES, CURRENCIES)
+            self.assertEqual(period.salary.amount, at.salaries[month][Currency.RUB])
+
+    def test_convert_at_outside_of_periods(self):
+        at = self.calculator.convert_at(self.index, date(2015, 10, 1), CURRENCIES, CURRENCIES)
+        self.assertEqual({}, at.salaries)
+        self.assertEqual({}, at.salaries_purchasing_power)
+
+
+if __name__ == '__main__':
+    unittest.main()
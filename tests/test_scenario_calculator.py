@@ -0,0 +1,66 @@
+import unittest
+from datetime import date
+
+from core.models import Currency, EmploymentPeriod, Salary
+from tests.support import OfflineConvertersTestCase
+
+
+class ScenarioCalculatorTest(OfflineConvertersTestCase):
+
+    def setUp(self):
+        super().setUp()
+        from core.currency_converter import CurrencySalaryConverter
+        from core.purchasing_power_converter.rub.converter import RubPurchasingPowerSalaryConverter
+        from core.salary_calculator.salary_calculator import SalaryCalculator
+        from core.scenario_calculator.scenario_calculator import ScenarioCalculator
+
+        currency_converter = CurrencySalaryConverter(None)
+        purchasing_power_converters = {Currency.RUB: RubPurchasingPowerSalaryConverter()}
+        self.salary_calculator = SalaryCalculator(currency_converter, purchasing_power_converters)
+        self.scenario_calculator = ScenarioCalculator(currency_converter, purchasing_power_converters)
+
+    def assertBaselineMatchesSalaryCalculator(self, periods):
+        from core.scenario_calculator.scenario_calculator import BASELINE
+
+        expected = self.salary_calculator.convert(periods, [Currency.RUB, Currency.USD], [Currency.RUB])
+        baseline = self.scenario_calculator.evaluate(periods, {})[BASELINE]
+
+        self.assertEqual(sorted(expected.salaries.keys()), baseline.months)
+        for idx, month in enumerate(baseline.months):
+            self.assertEqual(expected.salaries[month][Currency.RUB], baseline.salaries[idx], month)
+            self.assertEqual(expected.salaries[month][Currency.USD], baseline.salaries_usd[idx], month)
+            self.assertAlmostEqual(expected.salaries_purchasing_power[month][Currency.RUB],
+                                   baseline.salaries_purchasing_power[idx], msg=month)
+
+    def test_baseline_matches_salary_calculator(self):
+        self.assertBaselineMatchesSalaryCalculator([
+            EmploymentPeriod('Zavod, LLC', date(2014, 3, 1), date(2016, 3, 31), Salary(40000, Currency.RUB)),
+            EmploymentPeriod('Zavod, LLC', date(2016, 4, 1), date(2019, 12, 31), Salary(900, Currency.USD)),
+        ])
+
+    def test_baseline_matches_salary_calculator_mid_month_period(self):
+        self.assertBaselineMatchesSalaryCalculator([
+            EmploymentPeriod('Zavod, LLC', date(2014, 3, 15), date(2016, 3, 10), Salary(40000, Currency.RUB)),
+        ])
+
+    def test_baseline_matches_salary_calculator_end_of_month_period(self):
+        self.assertBaselineMatchesSalaryCalculator([
+            EmploymentPeriod('Zavod, LLC', date(2016, 1, 31), date(2017, 6, 30), Salary(50000, Currency.RUB)),
+        ])
+
+    def test_variants_share_months_with_baseline(self):
+        from core.scenario_calculator.scenario_calculator import BASELINE
+
+        baseline = [EmploymentPeriod('Zavod, LLC', date(2016, 1, 1), date(2017, 12, 31), Salary(50000, Currency.RUB))]
+        raised = [EmploymentPeriod('Zavod, LLC', date(2016, 1, 1), date(2016, 12, 31), Salary(50000, Currency.RUB)),
+                  EmploymentPeriod('Zavod, LLC', date(2017, 1, 1), date(2017, 12, 31), Salary(60000, Currency.RUB))]
+
+        results = self.scenario_calculator.evaluate(baseline, {'raise': raised})
+
+        self.assertEqual(results[BASELINE].months, results['raise'].months)
+        self.assertEqual(results[BASELINE].salaries_usd[:12], results['raise'].salaries_usd[:12])
+        self.assertGreater(results['raise'].purchasing_power_change, results[BASELINE].purchasing_power_change)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import calendar
+import random
+import unittest
+from bisect import bisect_left
+from datetime import date
+
+from core.date_util import add_months, month_generator
+from core.models import Currency, EmploymentPeriod, Salary
+from core.step_series import Run, StepSeries
+from tests.support import OfflineConvertersTestCase
+
+SEED = 31
+HISTORIES = 30
+
+
+def random_history(rnd: random.Random, overlapping: bool):
+    """
+    Consecutive jobs in roubles and dollars, mostly starting and ending on days 29-31.
+    Jobs of overlapping histories may start before the previous one ends
+    """
+    periods = []
+    begin = date(2012, rnd.randint(1, 12), 1)
+    for _ in range(rnd.randint(1, 6)):
+        begin = with_day(begin, rnd.choice([1, 15, 29, 30, 31]))
+        end = add_months(begin, rnd.randint(0, 20))
+        end = with_day(end, rnd.choice([end.day, 28, 30, 31]))
+
+        currency = rnd.choice([Currency.RUB, Currency.USD])
+        amount = rnd.choice([40000, 50000]) if currency == Currency.RUB else rnd.choice([900, 1000])
+        periods.append(EmploymentPeriod('Zavod, LLC', begin, end, Salary(amount, currency)))
+
+        begin = add_months(end, rnd.randint(-3, 2) if overlapping else rnd.randint(1, 2))
+    return periods
+
+
+def with_day(dt: date, day: int) -> date:
+    return dt.replace(day=min(day, calendar.monthrange(dt.year, dt.month)[1]))
+
+
+class StepSeriesTest(unittest.TestCase):
+
+    def test_append_merges_following_month_with_same_value(self):
+        series = StepSeries()
+        for month in month_generator(date(2020, 1, 31), date(2020, 6, 30)):
+            series.append(month, 100)
+        series.append(date(2020, 7, 29), 200)
+        series.append(date(2020, 9, 29), 200)
+
+        self.assertEqual([Run(date(2020, 1, 31), date(2020, 6, 29), 100),
+                          Run(date(2020, 7, 29), date(2020, 7, 29), 200),
+                          Run(date(2020, 9, 29), date(2020, 9, 29), 200)], series.runs)
+
+    def test_append_run_merges_contiguous_runs_only(self):
+        series = StepSeries()
+        series.append_run(date(2020, 1, 31), date(2020, 3, 29), 100)
+        series.append_run(date(2020, 4, 29), date(2020, 5, 29), 100)
+        series.append_run(date(2020, 6, 30), date(2020, 7, 30), 100)
+        series.append_run(date(2020, 8, 30), date(2020, 8, 30), None)
+
+        self.assertEqual([Run(date(2020, 1, 31), date(2020, 5, 29), 100),
+                          Run(date(2020, 6, 30), date(2020, 7, 30), 100),
+                          Run(date(2020, 8, 30), date(2020, 8, 30), None)], series.runs)
+
+    def test_append_run_rejects_overlap(self):
+        series = StepSeries()
+        series.append_run(date(2020, 1, 1), date(2020, 3, 1), 100)
+
+        with self.assertRaises(ValueError):
+            series.append_run(date(2020, 3, 1), date(2020, 4, 1), 200)
+
+    def test_from_dict_round_trip(self):
+        monthly = {month: 100 if month < date(2020, 5, 1) else 200
+                   for month in month_generator(date(2019, 12, 31), date(2020, 12, 31))}
+        monthly[date(2021, 2, 15)] = None
+
+        series = StepSeries.from_dict(monthly)
+
+        self.assertEqual(monthly, series.to_dict())
+        self.assertEqual(3, len(series))
+        for month, value in monthly.items():
+            self.assertEqual(value, series.value_at(month), month)
+        self.assertIsNone(series.value_at(date(2019, 12, 30)))
+        self.assertIsNone(series.value_at(date(2021, 1, 15)))
+
+    def test_change_points_match_monthly_step_plot(self):
+        monthly = {month: 100 if month < date(2020, 5, 1) else 200
+                   for month in month_generator(date(2019, 12, 31), date(2020, 12, 31))}
+        monthly.update({date(2021, 2, 15): None, date(2021, 3, 15): 300, date(2021, 4, 15): 300})
+
+        months, amounts = StepSeries.from_dict(monthly).change_points()
+
+        self.assertEqual(len(months), len(amounts))
+        self.assertEqual((date(2019, 12, 31), 100), (months[0], amounts[0]))
+        for month, value in monthly.items():
+            if value is not None:
+                # With where='pre' a point's value is drawn from the previous point up to it
+                self.assertEqual(value, amounts[bisect_left(months, month)], month)
+
+    def test_change_points_of_empty_series(self):
+        self.assertEqual(([], []), StepSeries().change_points())
+
+
+class ConvertSeriesTest(OfflineConvertersTestCase):
+
+    def setUp(self):
+        super().setUp()
+        from core.currency_converter import CurrencySalaryConverter
+        from core.purchasing_power_converter.rub.converter import RubPurchasingPowerSalaryConverter
+        from core.salary_calculator.salary_calculator import SalaryCalculator
+
+        self.currency_converter = CurrencySalaryConverter(None)
+        self.calculator = SalaryCalculator(self.currency_converter,
+                                           {Currency.RUB: RubPurchasingPowerSalaryConverter()})
+        self.rnd = random.Random(SEED)
+
+    def _assertSeriesMatchConvert(self, periods):
+        for currency in [Currency.RUB, Currency.USD]:
+            self.assertEqual(dict(self.currency_converter.convert(periods, currency)),
+                             self.currency_converter.convert_series(periods, currency).to_dict())
+
+        converted = self.calculator.convert(periods, [Currency.RUB], [Currency.RUB])
+        series = self.calculator.convert_series(periods, [Currency.RUB], [Currency.RUB])
+        self.assertEqual({month: salary[Currency.RUB] for month, salary in converted.salaries_purchasing_power.items()},
+                         series.salaries_purchasing_power[Currency.RUB].to_dict())
+
+    def test_end_of_month_periods(self):
+        self._assertSeriesMatchConvert([
+            EmploymentPeriod('Zavod, LLC', date(2016, 1, 31), date(2016, 6, 30), Salary(50000, Currency.RUB)),
+            EmploymentPeriod('Zavod, LLC', date(2016, 7, 30), date(2016, 12, 31), Salary(50000, Currency.RUB)),
+            EmploymentPeriod('Zavod, LLC', date(2017, 1, 29), date(2017, 8, 31), Salary(900, Currency.USD)),
+            EmploymentPeriod('Zavod, LLC', date(2017, 9, 30), date(2018, 3, 31), Salary(60000, Currency.RUB)),
+        ])
+
+    def test_random_histories(self):
+        for _ in range(HISTORIES):
+            self._assertSeriesMatchConvert(random_history(self.rnd, overlapping=False))
+
+    def test_random_overlapping_histories(self):
+        for _ in range(HISTORIES):
+            self._assertSeriesMatchConvert(random_history(self.rnd, overlapping=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest import mock
+
+from core.models import Currency, EmploymentPeriod, Salary
+from tests.support import OfflineConvertersTestCase, bundled_currency_converter
+
+THREADS = 8
+JOBS = 200
+
+
+class SharedSalaryCalculatorTest(OfflineConvertersTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.periods = [
+            EmploymentPeriod('Zavod, LLC', date(2014, 3, 1), date(2016, 3, 31), Salary(40000, Currency.RUB)),
+            EmploymentPeriod('Zavod, LLC', date(2016, 4, 1), date(2019, 12, 31), Salary(900, Currency.USD)),
+        ]
+        self.currencies = [Currency.USD, Currency.EUR, Currency.RUB]
+        self.currencies_purchasing_power = [Currency.RUB]
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.store_path = os.path.join(tmp_dir.name, 'conversions.sqlite3')
+
+    def _calculator(self, store_path):
+        from core.currency_converter import CurrencySalaryConverter
+        from core.purchasing_power_converter.rub.converter import RubPurchasingPowerSalaryConverter
+        from core.salary_calculator.salary_calculator import SalaryCalculator
+
+        purchasing_power_converter = RubPurchasingPowerSalaryConverter()
+        currency_converter = CurrencySalaryConverter(store_path)
+        calculator = SalaryCalculator(currency_converter, {Currency.RUB: purchasing_power_converter})
+        return calculator, currency_converter, purchasing_power_converter
+
+    def _convert(self, calculator):
+        return calculator.convert(self.periods, self.currencies, self.currencies_purchasing_power)
+
+    def test_threads_match_single_thread_with_refresh_in_the_middle(self):
+        expected = self._convert(self._calculator(None)[0])
+        calculator, currency_converter, purchasing_power_converter = self._calculator(self.store_path)
+        refreshed = threading.Event()
+
+        def job(idx):
+            if idx == JOBS // 2:
+                currency_converter.refresh_rates()
+                purchasing_power_converter.refresh()
+                refreshed.set()
+            return self._convert(calculator)
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            results = list(executor.map(job, range(JOBS)))
+
+        self.assertTrue(refreshed.is_set())
+        for result in results:
+            self.assertEqual(expected, result)
+
+    def test_threads_share_lazy_loading(self):
+        calculator, _, _ = self._calculator(self.store_path)
+        loads = []
+
+        def counting_load():
+            loads.append(1)
+            return bundled_currency_converter()
+
+        with mock.patch('core.currency_converter.converters._load_currency_converter', counting_load):
+            with ThreadPoolExecutor(THREADS) as executor:
+                list(executor.map(lambda _: self._convert(calculator), range(THREADS * 4)))
+
+        self.assertEqual(1, len(loads))
+
+
+if __name__ == '__main__':
+    unittest.main()